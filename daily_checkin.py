@@ -2,28 +2,53 @@
 """
 Tell Me More - Daily Check-in Script
 Runs at 6 PM to report progress, risks, and decisions
+
+Usage:
+    python3 daily_checkin.py
+    python3 daily_checkin.py --project-dir path/to/project --output report.md
 """
 
+import argparse
+import hashlib
 import os
+import pickle
 import re
 from datetime import datetime
 from pathlib import Path
 
 PROJECT_DIR = Path("/Users/pjames/NAS-Dev/openclaw/workspace/tell-me-more")
-OUTPUT_FILE = Path("/Users/pjames/NAS-Dev/openclaw/workspace/tell-me-more/daily_report.md")
+CACHE_DIR = Path.home() / ".cache" / "tell-me-more"
+CACHE_VERSION = 3  # Bump whenever the markdown patterns change what gets parsed
+
+# Markdown patterns. Each is swept separately with findall: one C-level scan
+# per construct beats a combined pattern or a Python per-line loop here.
+_PHASE_RE = re.compile(r'## Phase (\d): (.+?) \(Weeks (\d+)-(\d+)\)')
+_DONE_RE = re.compile(r'- \[x\] (.+)')
+_PENDING_RE = re.compile(r'- \[ \] (.+)')
+_HIGH_RE = re.compile(r'\| (\d+\.\d+) \|.+?\| High \| (.+?) \|')
+_MED_RE = re.compile(r'\| (\d+\.\d+) \|.+?\| Medium \| (.+?) \|')
+_MOD_RE = re.compile(r'### (.+?) Module (.+)')
+
 
+def _read(path):
+    """Read a markdown file as UTF-8 in one decode, normalising CRLF line endings"""
+    content = path.read_bytes().decode('utf-8', 'replace')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n')
+    return content
 
-def parse_roadmap():
+
+def parse_roadmap(project_dir=PROJECT_DIR):
     """Extract current phase and progress from ROADMAP.md"""
-    roadmap_file = PROJECT_DIR / "ROADMAP.md"
+    roadmap_file = project_dir / "ROADMAP.md"
     if not roadmap_file.exists():
-        return "No roadmap found"
+        return {}
     
-    content = roadmap_file.read_text()
+    content = _read(roadmap_file)
     
     # Find current phase
     phases = []
-    for match in re.finditer(r'## Phase (\d): (.+?) \(Weeks (\d+)-(\d+)\)', content):
+    for match in _PHASE_RE.finditer(content):
         phases.append({
             'num': match.group(1),
             'name': match.group(2),
@@ -32,8 +57,8 @@ def parse_roadmap():
         })
     
     # Find completed items (checked boxes)
-    completed = re.findall(r'- \[x\] (.+)', content)
-    pending = re.findall(r'- \[ \] (.+)', content)
+    completed = _DONE_RE.findall(content)
+    pending = _PENDING_RE.findall(content)
     
     return {
         'phases': phases,
@@ -42,23 +67,23 @@ def parse_roadmap():
     }
 
 
-def parse_engineering_review():
+def parse_engineering_review(project_dir=PROJECT_DIR):
     """Extract action items and concerns from ENGINEERING_REVIEW.md"""
-    review_file = PROJECT_DIR / "ENGINEERING_REVIEW.md"
+    review_file = project_dir / "ENGINEERING_REVIEW.md"
     if not review_file.exists():
         return {}
     
-    content = review_file.read_text()
+    content = _read(review_file)
     
     # Extract action items
-    action_items = re.findall(r'- \[ \] (.+)', content)
+    action_items = _PENDING_RE.findall(content)
     
     # Extract concerns by severity
-    high_severity = re.findall(r'\| (\d+\.\d+) \|.+?\| High \| (.+?) \|', content)
-    medium_severity = re.findall(r'\| (\d+\.\d+) \|.+?\| Medium \| (.+?) \|', content)
+    high_severity = _HIGH_RE.findall(content)
+    medium_severity = _MED_RE.findall(content)
     
     # Extract module status
-    module_status = re.findall(r'### (.+?) Module (.+)', content)
+    module_status = _MOD_RE.findall(content)
     
     return {
         'action_items': action_items,
@@ -68,7 +93,50 @@ def parse_engineering_review():
     }
 
 
-def get_file_stats():
+def _mtime_ns(path):
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def load_parsed(project_dir=PROJECT_DIR):
+    """Parse roadmap and review, reusing the cached results while neither file has changed"""
+    key = (
+        CACHE_VERSION,
+        str(project_dir),
+        _mtime_ns(project_dir / "ROADMAP.md"),
+        _mtime_ns(project_dir / "ENGINEERING_REVIEW.md")
+    )
+    
+    # One cache file per project so concurrent runs don't overwrite each other
+    digest = hashlib.sha1(str(project_dir.resolve()).encode()).hexdigest()[:12]
+    cache_file = CACHE_DIR / f"parsed-{digest}.pkl"
+    
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, roadmap, review = pickle.load(f)
+        if cached_key == key:
+            return roadmap, review
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass  # Missing or unreadable cache: parse from scratch
+    
+    roadmap = parse_roadmap(project_dir)
+    review = parse_engineering_review(project_dir)
+    
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump((key, roadmap, review), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+    
+    return roadmap, review
+
+
+def get_file_stats(project_dir=PROJECT_DIR):
     """Get last modified dates for key files"""
     files = [
         "PROJECT_PLAN.md",
@@ -81,29 +149,35 @@ def get_file_stats():
         "TOOLING.md"
     ]
     
+    # One directory listing instead of an exists() + stat() pair per path; on
+    # POSIX DirEntry.stat() still costs one stat() per wanted file
+    wanted = set(files)
+    mtimes = {}
+    with os.scandir(project_dir) as entries:
+        for entry in entries:
+            if entry.name in wanted and entry.is_file():
+                mtimes[entry.name] = entry.stat().st_mtime
+    
     stats = {}
     for f in files:
-        path = PROJECT_DIR / f
-        if path.exists():
-            mtime = datetime.fromtimestamp(path.stat().st_mtime)
-            stats[f] = mtime.strftime("%b %d")
+        if f in mtimes:
+            stats[f] = datetime.fromtimestamp(mtimes[f]).strftime("%b %d")
     
     return stats
 
 
-def generate_report():
+def generate_report(project_dir=PROJECT_DIR):
     """Generate the daily check-in report"""
     
     # Get current date
     today = datetime.now().strftime("%A, %b %d")
     
     # Parse data
-    roadmap = parse_roadmap()
-    review = parse_engineering_review()
-    stats = get_file_stats()
+    roadmap, review = load_parsed(project_dir)
+    stats = get_file_stats(project_dir)
     
     # Build report
-    report = f"""# 🎙️ TELL ME MORE | {today}
+    parts = [f"""# 🎙️ TELL ME MORE | {today}
 
 ## 📊 Project Status
 
@@ -116,16 +190,15 @@ def generate_report():
 
 ## ✅ What's Done
 
-"""
+"""]
     
     # Add completed items
     if roadmap.get('completed'):
-        for item in roadmap['completed'][:10]:
-            report += f"- {item}\n"
+        parts.extend(f"- {item}\n" for item in roadmap['completed'][:10])
     else:
-        report += "- No items marked complete yet\n"
+        parts.append("- No items marked complete yet\n")
     
-    report += """
+    parts.append("""
 
 ## 🎯 This Week's Focus
 
@@ -139,20 +212,19 @@ def generate_report():
 
 ## 🚨 Risks & Concerns
 
-"""
+""")
     
     # Add high severity concerns
     if review.get('high_severity'):
-        for item_id, concern in review['high_severity']:
-            report += f"- **{item_id}**: {concern}\n"
+        parts.extend(f"- **{item_id}**: {concern}\n" for item_id, concern in review['high_severity'])
     else:
-        report += "- No high-severity concerns\n"
+        parts.append("- No high-severity concerns\n")
     
-    report += """
+    parts.append("""
 
 ## 🤔 Decisions Needed
 
-"""
+""")
     
     # Extract key decisions from review
     decisions = [
@@ -163,10 +235,9 @@ def generate_report():
         "Whisper transcription approach (CPU vs GPU)"
     ]
     
-    for i, decision in enumerate(decisions, 1):
-        report += f"{i}. {decision}\n"
+    parts.extend(f"{i}. {decision}\n" for i, decision in enumerate(decisions, 1))
     
-    report += f"""
+    parts.append("""
 
 ---
 
@@ -174,12 +245,11 @@ def generate_report():
 
 | File | Last Updated |
 |------|--------------|
-"""
+""")
     
-    for file, date in stats.items():
-        report += f"| {file} | {date} |\n"
+    parts.extend(f"| {file} | {date} |\n" for file, date in stats.items())
     
-    report += """
+    parts.append("""
 
 ## 🔜 Next Steps
 
@@ -190,16 +260,32 @@ def generate_report():
 ---
 
 *Report generated: {}*
-""".format(datetime.now().strftime("%Y-%m-%d %I:%M %p"))
+""".format(datetime.now().strftime("%Y-%m-%d %I:%M %p")))
     
-    return report
+    return "".join(parts)
 
 
 def main():
-    report = generate_report()
+    parser = argparse.ArgumentParser(description="Tell Me More daily check-in report")
+    parser.add_argument(
+        "--project-dir",
+        type=Path,
+        default=PROJECT_DIR,
+        help=f"Project directory to report on (default: {PROJECT_DIR})"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Report file to write (default: daily_report.md in the project dir)"
+    )
+    args = parser.parse_args()
+    if not args.project_dir.is_dir():
+        parser.error(f"project dir not found: {args.project_dir}")
+    
+    report = generate_report(args.project_dir)
     
     # Save to file
-    OUTPUT_FILE.write_text(report)
+    (args.output or args.project_dir / "daily_report.md").write_text(report)
     
     # Print to stdout for Telegram
     print(report)
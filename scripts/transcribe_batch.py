@@ -5,61 +5,155 @@ whisper.cpp Batch Transcription Pipeline
 Usage:
     python3 scripts/transcribe_batch.py --input episodes.csv --output transcripts/
     python3 scripts/transcribe_batch.py --url "https://episode.mp3" --output transcripts/
+
+Requires: requests (pip install requests)
 """
 
 import argparse
+import contextlib
 import csv
+import functools
+import itertools
+import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
 
 # Configuration
 WHISPER_CPP_DIR = Path(__file__).parent.parent / "whisper.cpp"
-WHISPER_MODEL = WHISPER_CPP_DIR / "models" / "ggml-base.en.bin"
+# 5-bit quantized base.en: ~3x smaller than FP16 and faster on memory-bound encoders
+WHISPER_MODEL = WHISPER_CPP_DIR / "models" / "ggml-base.en-q5_1.bin"
 WHISPER_MAIN = WHISPER_CPP_DIR / "main"
 
+# whisperx backend (optional, GPU batched inference)
+WHISPERX_MODEL = "base.en"
+WHISPERX_BATCH_SIZE = 16
+
+# whisper.cpp is itself multi-threaded, so default to half the cores as jobs
+DEFAULT_JOBS = max(1, (os.cpu_count() or 1) // 2)
+DEFAULT_DOWNLOADERS = 2
+DEFAULT_CHUNK_SIZE = 8  # Episodes per whisper.cpp invocation (model loaded once per chunk)
+STAGING_DEPTH = 4  # Downloaded episodes waiting for whisper (bounds disk usage)
+HTTP_POOL_SIZE = 8  # Keep-alive connections kept per host
+DOWNLOAD_TIMEOUT = 60  # Seconds to connect / between received bytes
+
 # Colors for output
 GREEN = "\033[92m"
 YELLOW = "\033[93m"
 RED = "\033[91m"
 RESET = "\033[0m"
 
+# Colored prefix and logging level per log() level
+_PREFIX = {
+    "info": f"{GREEN}ℹ️ ",
+    "success": f"{GREEN}✅ ",
+    "error": f"{RED}❌ ",
+    "warn": f"{YELLOW}⚠️ ",
+}
+_LEVEL = {
+    "info": logging.INFO,
+    "success": logging.INFO,
+    "error": logging.ERROR,
+    "warn": logging.WARNING,
+}
+
+# Own stdout handler so log() prints without the caller configuring logging
+logger = logging.getLogger(__name__)
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Shared session so downloads from the same CDN reuse TCP/TLS connections
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
+
 
 def log(msg: str, level: str = "info"):
     """Colored logging."""
-    prefix = {"info": "ℹ️ ", "success": "✅ ", "error": "❌ ", "warn": "⚠️ "}
-    color = {"info": GREEN, "success": GREEN, "error": RED, "warn": YELLOW}
-    print(f"{color.get(level, GREEN)}{prefix.get(level, 'ℹ️ ')}{msg}{RESET}")
+    logger.log(_LEVEL.get(level, logging.INFO), f"{_PREFIX.get(level, _PREFIX['info'])}{msg}{RESET}")
 
 
+@functools.lru_cache(maxsize=1)
 def check_dependencies() -> bool:
-    """Check if whisper.cpp and model are available."""
+    """Check if whisper.cpp and model are available (once per process)."""
     if not WHISPER_MAIN.exists():
         log(f"whisper.cpp not found at {WHISPER_MAIN}", "error")
-        log("Run: cd whisper.cpp && make && ./models/download-ggml-model.sh base.en", "warn")
+        log("Run: cd whisper.cpp && make && ./models/download-ggml-model.sh base.en-q5_1", "warn")
         return False
     
     if not WHISPER_MODEL.exists():
         log(f"Model not found at {WHISPER_MODEL}", "error")
-        log("Run: ./models/download-ggml-model.sh base.en", "warn")
+        log("Run: ./models/download-ggml-model.sh base.en-q5_1", "warn")
         return False
     
     return True
 
 
+def prewarm_model(model_path: Path):
+    """Start reading the model into the page cache before whisper.cpp mmaps it.
+    
+    The page cache is shared, so every later whisper.cpp process (and chunk)
+    maps already-resident pages instead of faulting them in from disk.
+    No-op where posix_fadvise is unavailable (e.g. macOS).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    
+    try:
+        fd = os.open(model_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Only a hint; whisper.cpp will read the file regardless
+
+
+def init_worker(model_path: Path, log_queue: multiprocessing.Queue):
+    """Pool initializer: use the parent's model and log through its listener.
+    
+    Also checks dependencies once so the cached result is warm.
+    """
+    global WHISPER_MODEL
+    WHISPER_MODEL = model_path
+    
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    
+    check_dependencies()
+
+
+def whisper_threads(jobs: int) -> int:
+    """Threads per whisper.cpp process so that threads × jobs ≤ cores."""
+    return max(1, (os.cpu_count() or 1) // max(1, jobs))
+
+
 def download_audio(url: str, output_path: Path) -> bool:
     """Download audio file from URL."""
     log(f"Downloading {url}...")
-    result = subprocess.run(
-        ["curl", "-L", "-o", str(output_path), url],
-        capture_output=True,
-        text=True
-    )
-    
-    if result.returncode != 0:
-        log(f"Download failed: {result.stderr}", "error")
+    try:
+        with _SESSION.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            with open(output_path, "wb") as f:
+                # iter_content surfaces dropped connections as requests exceptions
+                for block in response.iter_content(chunk_size=1 << 20):
+                    f.write(block)
+    except (requests.RequestException, OSError) as e:
+        log(f"Download failed: {e}", "error")
+        output_path.unlink(missing_ok=True)  # Don't leave a partial file behind
         return False
     
     # Check file size
@@ -68,32 +162,199 @@ def download_audio(url: str, output_path: Path) -> bool:
     return True
 
 
-def transcribe_audio(audio_path: Path, output_dir: Path) -> Optional[Path]:
-    """Transcribe audio using whisper.cpp."""
-    episode_id = audio_path.stem
-    output_file = output_dir / f"{episode_id}.txt"
+def content_length(url: str) -> Optional[int]:
+    """Audio size in bytes from a HEAD request, if the server reports it."""
+    try:
+        response = _SESSION.head(url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        return int(response.headers["Content-Length"])
+    except (requests.RequestException, KeyError, ValueError):
+        return None
+
+
+def order_by_size(urls: List[str]) -> List[str]:
+    """Order episodes by audio size so each chunk holds similarly long episodes.
     
-    log(f"Transcribing {audio_path.name}...")
+    Sizes come from concurrent HEAD requests; episodes of unknown size go last.
+    """
+    with ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE) as pool:
+        sizes = list(pool.map(content_length, urls))
+    
+    order = sorted(range(len(urls)), key=lambda i: (sizes[i] is None, sizes[i] or 0))
+    return [urls[i] for i in order]
+
+
+def whisper_command(threads: Optional[int] = None) -> List[str]:
+    """Base whisper.cpp argv; callers append the input file(s).
     
+    Each input needs a matching `-of <path without .txt>`; whisper.cpp pairs
+    them by index and otherwise writes `<input>.txt` next to the audio.
+    """
     cmd = [
         str(WHISPER_MAIN),
         "-m", str(WHISPER_MODEL),
-        "-f", str(audio_path),
         "-otxt",
-        "-o", str(output_dir),
         "--max-len", "60",  # Max line length
         "--split-on-word",   # Split on word boundaries
     ]
+    if threads:
+        cmd += ["-t", str(threads)]
+    return cmd
+
+
+def transcribe_audio(audio_path: Path, output_dir: Path, threads: Optional[int] = None) -> Optional[Path]:
+    """Transcribe audio using whisper.cpp."""
+    episode_id = audio_path.stem
+    output_file = output_dir / f"{episode_id}.txt"
+    
+    log(f"Transcribing {audio_path.name}...")
+    output_file.unlink(missing_ok=True)  # A stale transcript (--force) must not pass as output
+    
+    cmd = whisper_command(threads) + ["-f", str(audio_path), "-of", str(output_dir / episode_id)]
     
     result = subprocess.run(
         cmd,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,  # Per-segment output; the transcript goes to file
+        stderr=subprocess.PIPE,
         timeout=3600  # 1 hour timeout
     )
     
     if result.returncode != 0:
-        log(f"Transcription failed: {result.stderr}", "error")
+        log(f"Transcription failed: {result.stderr.decode(errors='replace')}", "error")
+        return None
+    
+    if output_file.exists():
+        log(f"Transcript saved: {output_file.name}", "success")
+        return output_file
+    else:
+        log(f"Output file not created", "error")
+        return None
+
+
+def transcribe_many(audio_paths: List[Path], output_dir: Path,
+                    threads: Optional[int] = None) -> List[Optional[Path]]:
+    """Transcribe several files with one whisper.cpp invocation.
+    
+    The model is loaded once for the whole chunk instead of once per file.
+    Returns the transcript path for each input, or None where it is missing.
+    """
+    log(f"Transcribing {len(audio_paths)} files: {', '.join(p.name for p in audio_paths)}")
+    
+    cmd = whisper_command(threads)
+    for audio_path in audio_paths:
+        # A stale transcript (--force) must not pass as this run's output
+        (output_dir / f"{audio_path.stem}.txt").unlink(missing_ok=True)
+        cmd += ["-f", str(audio_path), "-of", str(output_dir / audio_path.stem)]
+    
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,  # Per-segment output; the transcript goes to file
+        stderr=subprocess.PIPE,
+        timeout=3600 * len(audio_paths)  # 1 hour per file
+    )
+    
+    if result.returncode != 0:
+        log(f"Transcription failed: {result.stderr.decode(errors='replace')}", "error")
+    
+    # whisper.cpp skips inputs it cannot read, but a whisper_full error aborts
+    # the rest of the run, so check each output
+    transcripts = []
+    for audio_path in audio_paths:
+        output_file = output_dir / f"{audio_path.stem}.txt"
+        if output_file.exists():
+            log(f"Transcript saved: {output_file.name}", "success")
+            transcripts.append(output_file)
+        elif result.returncode != 0:
+            # Retry on its own so one bad file doesn't fail the files queued after it
+            transcripts.append(transcribe_audio(audio_path, output_dir, threads))
+        else:
+            log(f"Output file not created for {audio_path.name}", "error")
+            transcripts.append(None)
+    
+    return transcripts
+
+
+def stream_transcribe(url: str, output_dir: Path, keep_audio: bool = False,
+                      threads: Optional[int] = None) -> Optional[Path]:
+    """Transcribe an episode without staging the audio on disk.
+    
+    The HTTP response is piped through ffmpeg (16 kHz mono WAV) into
+    whisper.cpp's stdin. With keep_audio the mp3 is also written to disk as
+    it streams past.
+    """
+    audio_path = episode_audio_path(url, output_dir)
+    output_file = output_dir / f"{audio_path.stem}.txt"
+    
+    log(f"Streaming {url} into whisper.cpp...")
+    output_file.unlink(missing_ok=True)  # A stale transcript (--force) must not pass as output
+    
+    ffmpeg = subprocess.Popen(
+        ["ffmpeg", "-loglevel", "error", "-i", "pipe:0",
+         "-ar", "16000", "-ac", "1", "-f", "wav", "pipe:1"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    whisper = subprocess.Popen(
+        whisper_command(threads) + ["-f", "-", "-of", str(output_dir / audio_path.stem)],
+        stdin=ffmpeg.stdout,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    ffmpeg.stdout.close()  # whisper.cpp holds the read end now
+    
+    download_errors = []
+    pipe_errors = []
+    
+    def feed():
+        try:
+            with _SESSION.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                with open(audio_path, "wb") if keep_audio else contextlib.nullcontext() as tee:
+                    for block in response.iter_content(chunk_size=1 << 20):
+                        ffmpeg.stdin.write(block)
+                        if tee:
+                            tee.write(block)
+        except requests.RequestException as e:
+            download_errors.append(e)
+        except OSError as e:
+            # Usually a broken pipe because ffmpeg or whisper.cpp exited early
+            pipe_errors.append(e)
+        finally:
+            with contextlib.suppress(OSError):
+                ffmpeg.stdin.close()
+    
+    # Feed from a thread so whisper.cpp's stderr is drained meanwhile
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    
+    try:
+        _, stderr = whisper.communicate(timeout=3600)  # 1 hour timeout
+    except subprocess.TimeoutExpired:
+        whisper.kill()
+        whisper.wait()
+        ffmpeg.kill()
+        stderr = b"timed out"
+    feeder.join()
+    ffmpeg.wait()
+    
+    # Report the root cause; a broken pipe is only a symptom of a process exiting
+    if download_errors:
+        error = f"Download failed: {download_errors[0]}"
+    elif whisper.returncode != 0:
+        error = f"Transcription failed: {stderr.decode(errors='replace')}"
+    elif ffmpeg.returncode != 0:
+        error = f"Audio decoding failed (ffmpeg exit code {ffmpeg.returncode})"
+    elif pipe_errors:
+        error = f"Streaming failed: {pipe_errors[0]}"
+    else:
+        error = None
+    
+    if error:
+        log(error, "error")
+        output_file.unlink(missing_ok=True)  # Don't let a partial transcript count as done
+        if keep_audio and download_errors:
+            audio_path.unlink(missing_ok=True)  # Nor keep a truncated copy of the audio
         return None
     
     if output_file.exists():
@@ -104,6 +365,36 @@ def transcribe_audio(audio_path: Path, output_dir: Path) -> Optional[Path]:
         return None
 
 
+def load_whisperx_model(name: str = WHISPERX_MODEL):
+    """Load a whisperx model once, on the GPU when one is available."""
+    import torch
+    import whisperx
+    
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    compute_type = "int8_float16" if device == "cuda" else "int8"
+    log(f"Loading whisperx {name} on {device} ({compute_type})...")
+    return whisperx.load_model(name, device, compute_type=compute_type)
+
+
+def transcribe_whisperx(model, audio_path: Path, output_dir: Path) -> Optional[Path]:
+    """Transcribe audio with an already-loaded whisperx model (batched segments)."""
+    import whisperx
+    
+    output_file = output_dir / f"{audio_path.stem}.txt"
+    log(f"Transcribing {audio_path.name} (whisperx)...")
+    
+    try:
+        audio = whisperx.load_audio(str(audio_path))
+        result = model.transcribe(audio, batch_size=WHISPERX_BATCH_SIZE)
+    except Exception as e:
+        log(f"Transcription failed: {e}", "error")
+        return None
+    
+    output_file.write_text("\n".join(seg["text"].strip() for seg in result["segments"]) + "\n")
+    log(f"Transcript saved: {output_file.name}", "success")
+    return output_file
+
+
 def cleanup_audio(audio_path: Path):
     """Delete audio file to save storage."""
     if audio_path.exists():
@@ -112,31 +403,149 @@ def cleanup_audio(audio_path: Path):
         log(f"Cleaned up {audio_path.name} ({size_mb:.1f} MB)")
 
 
-def process_episode(url: str, output_dir: Path, keep_audio: bool = False) -> Optional[Path]:
-    """Process a single episode: download → transcribe → cleanup."""
+def episode_id(url: str) -> str:
+    """Episode ID (file stem) derived from its URL."""
+    return url.split("/")[-1].split(".")[0]
+
+
+def episode_audio_path(url: str, output_dir: Path) -> Path:
+    """Local audio path for an episode URL."""
+    return output_dir / f"{episode_id(url)}.mp3"
+
+
+def existing_transcript(url: str, output_dir: Path) -> Optional[Path]:
+    """Non-empty transcript left by a previous run, if any."""
+    txt_path = output_dir / f"{episode_id(url)}.txt"
+    try:
+        if txt_path.stat().st_size > 0:
+            return txt_path
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def transcribe_and_cleanup(audio_path: Path, output_dir: Path, keep_audio: bool = False,
+                           threads: Optional[int] = None, model=None) -> Optional[Path]:
+    """Transcribe a downloaded episode, then delete its audio unless keep_audio.
+    
+    Uses the whisperx `model` when given, whisper.cpp otherwise.
+    """
+    try:
+        if model is not None:
+            return transcribe_whisperx(model, audio_path, output_dir)
+        return transcribe_audio(audio_path, output_dir, threads)
+    finally:
+        # Also on timeout, so a hung episode doesn't leave its audio staged
+        if not keep_audio:
+            cleanup_audio(audio_path)
+
+
+def transcribe_chunk_and_cleanup(audio_paths: List[Path], output_dir: Path, keep_audio: bool = False,
+                                 threads: Optional[int] = None, model=None) -> List[Optional[Path]]:
+    """Transcribe a chunk of downloaded episodes, then delete their audio unless keep_audio.
+    
+    Uses the whisperx `model` when given, whisper.cpp otherwise.
+    """
+    try:
+        if model is not None:
+            return [transcribe_whisperx(model, p, output_dir) for p in audio_paths]
+        return transcribe_many(audio_paths, output_dir, threads)
+    finally:
+        # Also on timeout, so a hung chunk doesn't leave its audio staged
+        if not keep_audio:
+            for audio_path in audio_paths:
+                cleanup_audio(audio_path)
+
+
+def process_episode(url: str, output_dir: Path, keep_audio: bool = False,
+                    threads: Optional[int] = None, model=None, force: bool = False) -> Optional[Path]:
+    """Process a single episode: download → transcribe → cleanup.
+    
+    With whisper.cpp and ffmpeg available the audio is streamed straight into
+    whisper.cpp instead, skipping the intermediate file. Episodes that already
+    have a transcript are skipped unless force is set.
+    """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Generate episode ID from URL
-    episode_id = url.split("/")[-1].split(".")[0]
-    audio_path = output_dir / f"{episode_id}.mp3"
+    if not force and (transcript_path := existing_transcript(url, output_dir)):
+        log(f"{transcript_path.name} already transcribed, skipping")
+        return transcript_path
+    
+    if model is None and shutil.which("ffmpeg"):
+        return stream_transcribe(url, output_dir, keep_audio, threads)
+    
+    audio_path = episode_audio_path(url, output_dir)
     
     # Download
     if not download_audio(url, audio_path):
         return None
     
-    # Transcribe
-    transcript_path = transcribe_audio(audio_path, output_dir)
+    return transcribe_and_cleanup(audio_path, output_dir, keep_audio, threads, model)
+
+
+def download_stage(urls: Iterable[str], output_dir: Path, staged: queue.Queue, workers: int):
+    """Download episodes with `workers` threads, feeding the `staged` queue.
     
-    # Cleanup (unless keep_audio is True)
-    if not keep_audio:
-        cleanup_audio(audio_path)
+    Puts (url, audio_path) per episode, with audio_path None if the download
+    failed. Once all downloads have finished it puts a final None, or the
+    exception that stopped `urls` (e.g. a malformed CSV) for the consumer to
+    re-raise.
+    """
+    todo: queue.Queue = queue.Queue(maxsize=workers)
     
-    return transcript_path
+    def worker():
+        while True:
+            url = todo.get()
+            if url is None:
+                return
+            audio_path = episode_audio_path(url, output_dir)
+            try:
+                ok = download_audio(url, audio_path)
+            except Exception as e:
+                log(f"Download failed: {e}", "error")
+                ok = False
+            staged.put((url, audio_path if ok else None))
+    
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    error = None
+    try:
+        for url in urls:
+            todo.put(url)
+    except BaseException as e:
+        error = e
+    finally:
+        # Always release the downloaders and the consumer, even if reading URLs failed
+        for _ in threads:
+            todo.put(None)
+        for t in threads:
+            t.join()
+        staged.put(error)
 
 
-def process_csv(input_file: str, output_dir: str, limit: int = 0):
-    """Process multiple episodes from CSV file."""
+def process_csv(input_file: str, output_dir: str, limit: int = 0,
+                jobs: int = DEFAULT_JOBS, keep_audio: bool = False,
+                downloaders: int = DEFAULT_DOWNLOADERS, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                model=None, sort_by_size: bool = False, force: bool = False):
+    """Process multiple episodes from CSV file.
+    
+    Downloads run in a thread pool ahead of transcription. Downloaded episodes
+    are grouped into chunks of `chunk_size`, and each chunk is transcribed by a
+    single whisper.cpp invocation in a pool of worker processes. At most
+    STAGING_DEPTH downloaded episodes wait on disk beyond the chunks in flight.
+    
+    With a whisperx `model`, chunks are transcribed in this process instead,
+    keeping the model loaded on the GPU for the whole CSV.
+    
+    With `sort_by_size`, all rows are read up front and episodes are processed
+    smallest first, so chunks finish evenly instead of waiting on one long
+    episode.
+    
+    Episodes whose transcript already exists are skipped before download, so
+    an interrupted run resumes where it stopped; `force` re-transcribes them.
+    """
     input_path = Path(input_file)
     output_path = Path(output_dir)
     
@@ -144,45 +553,166 @@ def process_csv(input_file: str, output_dir: str, limit: int = 0):
         log(f"Input file not found: {input_file}", "error")
         return
     
+    output_path.mkdir(parents=True, exist_ok=True)
     log(f"Reading episodes from {input_file}...")
     
-    with open(input_path, "r") as f:
-        reader = csv.DictReader(f)
-        episodes = list(reader)
+    # Cheap line count for progress; rows themselves are streamed below
+    with open(input_path, "rb") as f:
+        total = max(0, sum(1 for _ in f) - 1)
     
-    log(f"Found {len(episodes)} episodes to process")
+    log(f"Found {total} episodes to process")
     
     if limit > 0:
-        episodes = episodes[:limit]
+        total = min(total, limit)
         log(f"Processing first {limit} episodes")
     
-    success = 0
-    failed = 0
+    counts = {"success": 0, "failed": 0, "skipped": 0}
+    threads = whisper_threads(jobs)
+    
+    def episode_urls(rows: Iterable[dict]) -> Iterable[str]:
+        for i, episode in enumerate(rows, 1):
+            url = episode.get("url") or episode.get("audio_url")
+            if not url:
+                log(f"Skipping row {i}: no URL", "warn")
+                continue
+            if not force and (transcript_path := existing_transcript(url, output_path)):
+                counts["skipped"] += 1
+                log(f"{transcript_path.name} already transcribed, skipping")
+                continue
+            yield url
+    
+    def finish(url: str, ok: bool):
+        counts["success" if ok else "failed"] += 1
+        done = counts["success"] + counts["failed"] + counts["skipped"]
+        log(f"[{done}/{total}] {'Done' if ok else 'Failed'}: {url}",
+            "success" if ok else "error")
     
-    for i, episode in enumerate(episodes, 1):
-        url = episode.get("url") or episode.get("audio_url")
-        if not url:
-            log(f"Skipping row {i}: no URL", "warn")
-            continue
+    def collect(futures: dict, future):
+        chunk_urls = futures.pop(future)
+        try:
+            transcripts = future.result()
+        except Exception as e:
+            log(f"Chunk failed: {e}", "error")
+            transcripts = [None] * len(chunk_urls)
+        for url, transcript in zip(chunk_urls, transcripts):
+            finish(url, transcript is not None)
+    
+    log(f"Running {downloaders} downloaders, {jobs} jobs × {threads} whisper threads, "
+        f"{chunk_size} episodes per chunk")
+    
+    staged: queue.Queue = queue.Queue(maxsize=STAGING_DEPTH)
+    
+    # Keep the CSV open while the download stage streams rows from it
+    with open(input_path, "r", newline="") as f:
+        rows = csv.DictReader(f)
+        if limit > 0:
+            rows = itertools.islice(rows, limit)
         
-        log(f"\n[{i}/{len(episodes)}] Processing...")
+        urls = episode_urls(rows)
+        if sort_by_size:
+            log("Sorting episodes by audio size...")
+            urls = order_by_size(list(urls))
         
-        if process_episode(url, output_path):
-            success += 1
-        else:
-            failed += 1
+        # Workers start while the download threads are running, and forking a
+        # multi-threaded process can deadlock the child, so always spawn them
+        mp_context = multiprocessing.get_context("spawn")
+        
+        # Workers send log records here; one listener writes them without interleaving
+        log_queue = mp_context.Queue()
+        listener = logging.handlers.QueueListener(log_queue, _handler)
+        listener.start()
+        
+        producer = threading.Thread(
+            target=download_stage,
+            args=(urls, output_path, staged, downloaders),
+            daemon=True
+        )
+        producer.start()
+        
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context, initializer=init_worker,
+                                 initargs=(WHISPER_MODEL, log_queue)) as pool:
+            running = {}
+            chunk = []
+            
+            def submit_chunk():
+                audio_paths = [audio_path for _, audio_path in chunk]
+                chunk_urls = [url for url, _ in chunk]
+                chunk.clear()
+                
+                if model is not None:
+                    transcripts = transcribe_chunk_and_cleanup(audio_paths, output_path, keep_audio, model=model)
+                    for url, transcript in zip(chunk_urls, transcripts):
+                        finish(url, transcript is not None)
+                    return
+                
+                # Hold further downloads in the queue until a transcription slot frees up
+                if len(running) >= jobs:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(running, future)
+                
+                future = pool.submit(transcribe_chunk_and_cleanup, audio_paths, output_path, keep_audio, threads)
+                running[future] = chunk_urls
+            
+            while isinstance(item := staged.get(), tuple):
+                url, audio_path = item
+                if audio_path is None:
+                    finish(url, False)
+                    continue
+                
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    submit_chunk()
+            
+            if chunk:
+                submit_chunk()
+            
+            for future in as_completed(list(running)):
+                collect(running, future)
+        
+        listener.stop()
+        producer.join()
+    
+    if item is not None:
+        raise item  # Reading the CSV failed in the download stage
     
     log(f"\n{'='*50}")
     log(f"Processing complete!", "success")
-    log(f"Success: {success}")
-    log(f"Failed: {failed}")
-    log(f"Total: {success + failed}")
+    log(f"Success: {counts['success']}")
+    log(f"Failed: {counts['failed']}")
+    log(f"Skipped: {counts['skipped']}")
+    log(f"Total: {counts['success'] + counts['failed'] + counts['skipped']}")
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
 
 
 def main():
+    global WHISPER_MODEL
+    
     parser = argparse.ArgumentParser(
         description="Batch transcription using whisper.cpp"
     )
+    parser.add_argument(
+        "--backend",
+        choices=["whispercpp", "whisperx"],
+        default="whispercpp",
+        help="Transcription engine; whisperx batches on the GPU when available (default: whispercpp)"
+    )
+    parser.add_argument(
+        "--model", "-m",
+        type=Path,
+        default=WHISPER_MODEL,
+        help=f"whisper.cpp ggml model (default: {WHISPER_MODEL.name})"
+    )
     parser.add_argument(
         "--input", "-i",
         help="CSV file with episode URLs (column: url or audio_url)"
@@ -207,17 +737,57 @@ def main():
         action="store_true",
         help="Keep audio files after transcription"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-transcribe episodes that already have a transcript"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=positive_int,
+        default=DEFAULT_JOBS,
+        help=f"Episodes to process in parallel (default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--downloaders",
+        type=positive_int,
+        default=DEFAULT_DOWNLOADERS,
+        help=f"Concurrent downloads feeding transcription (default: {DEFAULT_DOWNLOADERS})"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Episodes per whisper.cpp invocation (default: {DEFAULT_CHUNK_SIZE})"
+    )
+    parser.add_argument(
+        "--sort-by-size",
+        action="store_true",
+        help="Process episodes smallest first so chunks hold similar lengths (reads the whole CSV up front)"
+    )
     
     args = parser.parse_args()
+    WHISPER_MODEL = args.model
     
-    # Check dependencies
-    if not check_dependencies():
+    model = None
+    if args.backend == "whisperx":
+        # Load once and keep it resident for every episode
+        try:
+            model = load_whisperx_model()
+        except ImportError:
+            log("whisperx not installed", "error")
+            log("Run: pip install whisperx", "warn")
+            sys.exit(1)
+    elif not check_dependencies():
         sys.exit(1)
+    else:
+        prewarm_model(WHISPER_MODEL)
     
     if args.input:
-        process_csv(args.input, args.output, args.limit)
+        process_csv(args.input, args.output, args.limit, args.jobs, args.keep_audio,
+                    args.downloaders, args.chunk_size, model, args.sort_by_size, args.force)
     elif args.url:
-        process_episode(args.url, args.output, args.keep_audio)
+        process_episode(args.url, args.output, args.keep_audio, model=model, force=args.force)
     else:
         parser.print_help()
         sys.exit(1)